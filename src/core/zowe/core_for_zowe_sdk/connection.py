@@ -19,7 +19,8 @@ class ApiConnection:
     Attributes
     ----------
     host_url: str
-        The base url of the rest api host
+        The base url of the rest api host, e.g. "host:port". A scheme such as
+        "https://host:port" may be included; https is used when it is omitted
     user: str
         The user of the rest api
     password: str
@@ -25,6 +25,9 @@ class RequestHandler:
     ----------
     session_arguments: dict
         Zowe SDK session arguments
+    session: requests.Session
+        Session reused across requests, so connections are kept alive and
+        cookies set by z/OSMF are sent on subsequent requests
     valid_methods: list
         List of supported request methods
     """
@@ -39,9 +42,20 @@ class RequestHandler:
             The Zowe SDK session arguments
         """
         self.session_arguments = session_arguments
+        self.session = requests.Session()
         self.valid_methods = ["GET", "POST", "PUT", "DELETE"]
         self.handle_ssl_warnings()
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Close the handler session and release its pooled connections."""
+        self.session.close()
+
     def handle_ssl_warnings(self):
         """Turn off warnings if the SSL verification argument if off."""
         if not self.session_arguments['verify']:
@@ -84,11 +98,10 @@ class RequestHandler:
             raise InvalidRequestMethod(self.method)
 
     def send_request(self):
-        """Build a custom session object, prepare it with a custom request and send it."""
-        session = requests.Session()
+        """Prepare a custom request on the handler session and send it."""
         request_object = requests.Request(method=self.method, **self.request_arguments)
-        prepared = session.prepare_request(request_object)
-        self.response = session.send(prepared, **self.session_arguments)
+        prepared = self.session.prepare_request(request_object)
+        self.response = self.session.send(prepared, **self.session_arguments)
 
     def validate_response(self):
         """Validate if request response is acceptable based on expected code list.
@@ -39,8 +39,11 @@ class SdkApi:
             "Content-type": "application/json",
             "X-CSRF-ZOSMF-HEADER": ""
         }
-        self.request_endpoint = "https://{base_url}{service}".format(
-            base_url=self.connection.host_url, service=self.default_service_url
+        base_url = self.connection.host_url.rstrip("/")
+        if "://" not in base_url:
+            base_url = "https://{}".format(base_url)
+        self.request_endpoint = "{base_url}{service}".format(
+            base_url=base_url, service=self.default_service_url
         )
         self.request_arguments = {
             "url": self.request_endpoint,
@@ -53,10 +56,24 @@ class SdkApi:
         }
         self.request_handler = RequestHandler(self.session_arguments)
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Close the underlying request session."""
+        self.request_handler.close()
+
     def create_custom_request_arguments(self):
         """Create a copy of the default request arguments dictionary.
 
         This method is required because the way that Python handles
-        dictionary creation
+        dictionary creation. The headers dictionary is copied as well so
+        callers can override individual headers without changing the
+        defaults used by later requests.
         """
-        return self.request_arguments.copy()
+        custom_args = self.request_arguments.copy()
+        custom_args["headers"] = custom_args["headers"].copy()
+        return custom_args